@@ -25,8 +25,7 @@ Usage:
 def main() -> None:
     print(DOC)
     shell = Shell()
-    while True:
-        shell.enter_command_to_execute()
+    shell.enter_command_to_execute()
 
 
 if __name__ == '__main__':
@@ -1,21 +1,14 @@
 from __future__ import annotations
 
-from binascii import hexlify, unhexlify
-
-from hashlib import (
-    blake2b,
-    blake2s,
-    md5,
-    sha1,
-    sha224,
-    sha256,
-    sha384,
-    sha3_224,
-    sha3_256,
-    sha3_384,
-    sha3_512,
-    sha512,
-)
+import sys
+
+from hashlib import new
+from importlib.util import find_spec
+
+try:
+    from hashlib import file_digest
+except ImportError:  # Python < 3.11
+    file_digest = None  # type: ignore
 from base64 import (
     a85decode,
     a85encode,
@@ -36,11 +29,37 @@ from base64 import (
     b85encode
 )
 
+try:
+    # SIMD accelerated drop-in replacements, used when installed
+    from pybase64 import b64decode, b64encode, b64encode_as_string  # type: ignore
+except ImportError:
+    def b64encode_as_string(s: bytes) -> str:  # type: ignore
+        return b64encode(s).decode('ascii')
 
+
+from contextlib import contextmanager
 from enum import Enum
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Callable, ClassVar
+from typing import Any, BinaryIO, Callable, ClassVar, Iterator
+
+
+# inputs prefixed with this are read from the named file instead of taken literally
+FILE_INPUT_PREFIX = '@'
+
+# inputs prefixed with this name a file holding one input per line
+LINES_INPUT_PREFIX = '@@'
+
+# inputs prefixed with this are taken literally, minus the backslash, e.g. \@user -> @user
+ESCAPED_INPUT_PREFIX = '\\@'
+
+# block size used when feeding large inputs to a hasher incrementally
+CHUNK_SIZE = 1024 * 1024
+
+# read size used when streaming files through a codec; a multiple of every encoder's
+# input block size (1, 3, 4 and 5 bytes), so chunks can be encoded independently
+STREAM_CHUNK_SIZE = 60 * 2048
+
+# bytes ignored between encoded groups when decoding a file, e.g. line wraps
+_WHITESPACE = b' \t\r\n'
 
 
 class CommandName(Enum):
@@ -56,81 +75,141 @@ class CommandNameConversionError(Exception):
         super().__init__(message)
 
 
+def _as_text(encoder: Callable[[bytes], bytes]) -> Callable[[bytes], str]:
+    """ Wraps a bytes -> bytes textual encoder so that it returns the encoded text. """
+    def encode(data: bytes) -> str:
+        return encoder(data).decode('ascii')
+
+    return encode
+
+
+def _input_file_error(path: str, error: OSError) -> ValueError:
+    return ValueError(f'Cannot read input file: {path}; {error.strerror or error}')
+
+
+@contextmanager
+def _open_input_file(path: str) -> Iterator[BinaryIO]:
+    # only opening is translated, so errors raised while the caller writes output keep their type
+    try:
+        file = open(path, 'rb')
+    except OSError as error:
+        raise _input_file_error(path, error) from error
+
+    with file:
+        yield file
+
+
+def _split_input_source(input_data: str) -> tuple[str, str]:
+    """ Returns the input's source prefix ('' for literal text) and the text or path after it. """
+    if input_data.startswith(ESCAPED_INPUT_PREFIX):
+        return '', input_data[1:]
+
+    # a bare prefix names no file, so it is ordinary text
+    if input_data in (FILE_INPUT_PREFIX, LINES_INPUT_PREFIX):
+        return '', input_data
+
+    for prefix in (LINES_INPUT_PREFIX, FILE_INPUT_PREFIX):
+        if input_data.startswith(prefix):
+            return prefix, input_data[len(prefix):]
+
+    return '', input_data
+
+
+def _new_hasher(name: str) -> Any:
+    if name == 'blake3':
+        # imported on first use; lets large inputs be hashed across all cores
+        try:
+            from blake3 import blake3  # type: ignore
+        except ImportError as error:
+            raise ValueError(f'Algorithm unavailable: BLAKE3; {error}') from error
+        return blake3(max_threads=blake3.AUTO)
+
+    return new(name)
+
+
+def _from_hex(data: bytes | str) -> bytes:
+    return bytes.fromhex(data if isinstance(data, str) else data.decode('ascii'))
+
+
+def _read_input_lines(path: str) -> Iterator[bytes]:
+    with _open_input_file(path) as file:
+        for line in file:
+            yield line.rstrip(b'\r\n')
+
+
 def str_to_command_name(name: str) -> CommandName:
-    if name.upper() not in CommandName.__members__.keys():
+    member = CommandName.__members__.get(name.upper())
+    if member is None:
         raise CommandNameConversionError(f'Invalid command name: {name}')
 
-    return CommandName[name.upper()]
+    return member
 
 
 def command_factory(name: CommandName) -> Command:
-    if name == CommandName.EXIT:
-        return ExitCommand(name)
-    elif name == CommandName.HELP:
-        return HelpCommand(name)
-    elif name == CommandName.ENCODE:
-        return EncodeCommand(name)
-    elif name == CommandName.DECODE:
-        return DecodeCommand(name)
-    elif name == CommandName.HASH:
-        return HashCommand(name)
-    else:
-        raise NotImplementedError(f'Command not implemented: {name}')
-
-
-@dataclass
-class Command(ABC):
-    name: CommandName
+    try:
+        command_type = _FACTORY[name]
+    except KeyError:
+        raise NotImplementedError(f'Command not implemented: {name}') from None
+
+    return command_type(name)
+
+
+class Command:
+    __slots__ = ('name',)
+
+    def __init__(self, name: CommandName) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(name={self.name!r})'
 
     def get_name(self) -> CommandName:
         return self.name
 
-    @abstractmethod
     def execute(self, argv: list[str]) -> None:
-        # self._validate_argv()
-        pass
+        raise NotImplementedError(f'{type(self).__name__} does not implement execute: {self.name}')
 
-    @abstractmethod
-    def _validate_argv(self, argv: list[str]) -> None:
-        pass
 
-
-@dataclass
 class HelpCommand(Command):
+    __slots__ = ()
+
     DOCUMENTATION: ClassVar[str] = """
 
 To encode/Decode:
     Encode/Decode <Text> <Algorithm>
+    Encode/Decode @<File> <Algorithm>
+    Encode/Decode @@<File> <Algorithm>   (one input per line)
     Encode/Decode only for help.
 To hash:
     Hash <Text> <Algorithm>
+    Hash @<File> <Algorithm>
+    Hash @@<File> <Algorithm>   (one input per line)
     Hash only for help.
+Text starting with @ is read as a file name; write \\@ for a literal leading @.
 
     """
 
     def execute(self, argv: list[str]) -> None:
-        self._validate_argv(argv)
-        print(HelpCommand.DOCUMENTATION)
-
-    def _validate_argv(self, argv: list[str]) -> None:
         if len(argv) != 0:
             raise ValueError(f'This command takes no arguments: {self.name}')
 
+        print(HelpCommand.DOCUMENTATION)
+
 
-@dataclass
 class ExitCommand(Command):
-    def execute(self, argv: list[str]) -> None:
-        self._validate_argv(argv)
-        print('Exiting...')
-        exit(0)
+    __slots__ = ()
 
-    def _validate_argv(self, argv: list[str]) -> None:
+    def execute(self, argv: list[str]) -> None:
         if len(argv) != 0:
             raise ValueError(f'This command takes no arguments: {self.name}')
 
+        print('Exiting...')
+        exit(0)
+
 
-@dataclass
 class DecodeCommand(Command):
+    __slots__ = ()
+
     ALGORITHMS: ClassVar[dict[str, Callable[[bytes | str], bytes]]] = {
         "A85": a85decode,
         "BASE16": b16decode,
@@ -138,114 +217,238 @@ class DecodeCommand(Command):
         "BASE32HEX": b32hexdecode,
         "BASE64": b64decode,
         "BASE85": b85decode,
-        "HEXLIFY": unhexlify
+        "HEXLIFY": _from_hex
     }
 
-    DOCUMENTATION: str = f'Syntax: Decode <InputText> < {" | ".join(list(ALGORITHMS.keys()))} >'
+    # encoded characters per independently decodable group; A85 is missing since its
+    # 'z' shorthand and <~ ~> framing make groups variable length, so it is decoded in one go
+    BLOCK_SIZES: ClassVar[dict[str, int]] = {
+        "BASE16": 2,
+        "BASE32": 8,
+        "BASE32HEX": 8,
+        "BASE64": 4,
+        "BASE85": 5,
+        "HEXLIFY": 2
+    }
+
+    DOCUMENTATION: ClassVar[str] = f'Syntax: Decode <InputText | @InputFile | @@LinesFile> < {" | ".join(ALGORITHMS)} >'
 
     def execute(self, argv: list[str]) -> None:
         if len(argv) == 0:
             print(DecodeCommand.DOCUMENTATION)
             return
 
-        self._validate_argv(argv)
+        if len(argv) != 2:
+            raise ValueError(f'This command takes exactly 2 arguments: {self.name}')
+
         input_data, algorithm = argv
 
-        func_ = DecodeCommand.ALGORITHMS[algorithm.upper().strip()]
+        key = algorithm.upper()
+        func_ = DecodeCommand.ALGORITHMS.get(key)
+        if func_ is None:
+            raise ValueError(f'Invalid algorithm name: {algorithm}; '
+                             f'Available algorithms: {" | ".join(DecodeCommand.ALGORITHMS)}')
+
+        source, input_data = _split_input_source(input_data)
+        if source == LINES_INPUT_PREFIX:
+            self._decode_lines(input_data, func_)
+            return
+
+        if source == FILE_INPUT_PREFIX:
+            self._decode_file(input_data, func_, DecodeCommand.BLOCK_SIZES.get(key))
+            return
 
         # first decode from text encoded string to bytes, then decode from bytes to python string
         print(func_(input_data).decode())
 
-    def _validate_argv(self, argv: list[str]) -> None:
-        if len(argv) != 2:
-            raise ValueError(f'This command takes exactly 2 arguments: {self.name}')
+    def _decode_file(self, path: str, func_: Callable[[bytes], bytes], block_size: int | None) -> None:
+        # decoded file contents may be arbitrary binary, so they go to the underlying byte stream
+        sys.stdout.flush()
+        output = sys.stdout.buffer
 
-        _, algorithm = argv
-        available_algorithms = DecodeCommand.ALGORITHMS.keys()
+        with _open_input_file(path) as file:
+            if block_size is None:
+                output.write(func_(file.read()))
+            else:
+                carry = b''
+                while chunk := file.read(STREAM_CHUNK_SIZE):
+                    data = carry + chunk.translate(None, _WHITESPACE)
+                    cut = len(data) - len(data) % block_size
+                    output.write(func_(data[:cut]))
+                    carry = data[cut:]
 
-        if algorithm.upper().strip() not in DecodeCommand.ALGORITHMS.keys():
-            raise ValueError(f"Invalid algorithm name: {algorithm};" +
-                             f"Available algorithms: {available_algorithms}")
+                # a trailing partial group is handed over so the decoder reports it
+                output.write(func_(carry))
 
+        # keep redirected output byte-identical to the original data
+        if output.isatty():
+            output.write(b'\n')
+        output.flush()
 
-@dataclass
-class EncodeCommand(Command):
+    def _decode_lines(self, path: str, func_: Callable[[bytes], bytes]) -> None:
+        sys.stdout.flush()
+        output = sys.stdout.buffer
+
+        for line in _read_input_lines(path):
+            output.write(func_(line) + b'\n')
+
+        output.flush()
 
-    ALGORITHMS: ClassVar[dict[str, Callable[[bytes], bytes]]] = {
-        "A85": a85encode,
-        "BASE16": b16encode,
-        "BASE32": b32encode,
-        "BASE32HEX": b32hexencode,
-        "BASE64": b64encode,
-        "BASE85": b85encode,
-        "HEXLIFY": hexlify
+
+class EncodeCommand(Command):
+    __slots__ = ()
+
+    ALGORITHMS: ClassVar[dict[str, Callable[[bytes], str]]] = {
+        "A85": _as_text(a85encode),
+        "BASE16": _as_text(b16encode),
+        "BASE32": _as_text(b32encode),
+        "BASE32HEX": _as_text(b32hexencode),
+        "BASE64": b64encode_as_string,
+        "BASE85": _as_text(b85encode),
+        "HEXLIFY": bytes.hex
     }
 
-    DOCUMENTATION: str = f'Syntax: Encode <InputText> < {" | ".join(list(ALGORITHMS.keys()))} > '
+    DOCUMENTATION: ClassVar[str] = f'Syntax: Encode <InputText | @InputFile | @@LinesFile> < {" | ".join(ALGORITHMS)} > '
 
     def execute(self, argv: list[str]) -> None:
         if len(argv) == 0:
             print(EncodeCommand.DOCUMENTATION)
             return
 
-        self._validate_argv(argv)
+        if len(argv) != 2:
+            raise ValueError(f'This command takes exactly 2 arguments: {self.name}')
+
         input_data, algorithm = argv
 
-        func_ = EncodeCommand.ALGORITHMS[algorithm.upper().strip()]
+        func_ = EncodeCommand.ALGORITHMS.get(algorithm.upper())
+        if func_ is None:
+            raise ValueError(f'Invalid algorithm name: {algorithm}; '
+                             f'Available algorithms: {" | ".join(EncodeCommand.ALGORITHMS)}')
+
+        source, input_data = _split_input_source(input_data)
+        if source == LINES_INPUT_PREFIX:
+            self._encode_lines(input_data, func_)
+            return
+
+        if source == FILE_INPUT_PREFIX:
+            self._encode_file(input_data, func_)
+            return
 
         # character encoding, i.e. get bytes from string
         input_data_bytes = input_data.encode()
 
-        # textual encoding, i.e. still bytes but encoded in a different way
-        print(func_(input_data_bytes))
+        # textual encoding, written out as text rather than the repr of a bytes object
+        sys.stdout.write(func_(input_data_bytes) + '\n')
 
-    def _validate_argv(self, argv: list[str]) -> None:
-        if len(argv) != 2:
-            raise ValueError(f'This command takes exactly 2 arguments: {self.name}')
+    def _encode_file(self, path: str, func_: Callable[[bytes], str]) -> None:
+        with _open_input_file(path) as file:
+            while chunk := file.read(STREAM_CHUNK_SIZE):
+                sys.stdout.write(func_(chunk))
 
-        _, algorithm = argv
-        available_algorithms = EncodeCommand.ALGORITHMS.keys()
+        sys.stdout.write('\n')
 
-        if algorithm.upper().strip() not in available_algorithms:
-            raise ValueError(f"Invalid algorithm name: {algorithm};" +
-                             f"Available algorithms: {available_algorithms}")
+    def _encode_lines(self, path: str, func_: Callable[[bytes], str]) -> None:
+        for line in _read_input_lines(path):
+            sys.stdout.write(func_(line) + '\n')
 
 
-@dataclass
 class HashCommand(Command):
-    ALGORITHMS: ClassVar = {
-        "BLAKE2B": blake2b,
-        "BLAKE2S": blake2s,
-        "MD5": md5,
-        "SHA1": sha1,
-        "SHA224": sha224,
-        "SHA256": sha256,
-        "SHA384": sha384,
-        "SHA3_224": sha3_224,
-        "SHA3_256": sha3_256,
-        "SHA3_384": sha3_384,
-        "SHA3_512": sha3_512,
-        "SHA512": sha512
+    __slots__ = ()
+
+    # hashlib names of the supported digests
+    ALGORITHMS: ClassVar[dict[str, str]] = {
+        "BLAKE2B": "blake2b",
+        "BLAKE2S": "blake2s",
+        # parallel, SIMD accelerated tree hash, offered when installed
+        **({"BLAKE3": "blake3"} if find_spec('blake3') is not None else {}),
+        "MD5": "md5",
+        "SHA1": "sha1",
+        "SHA224": "sha224",
+        "SHA256": "sha256",
+        "SHA384": "sha384",
+        "SHA3_224": "sha3_224",
+        "SHA3_256": "sha3_256",
+        "SHA3_384": "sha3_384",
+        "SHA3_512": "sha3_512",
+        "SHA512": "sha512"
     }
 
-    DOCUMENTATION: ClassVar[str] = f'Syntax: Hash <InputText> < {" | ".join(list(ALGORITHMS.keys()))} >'
+    # idle prototype hashers, created on first use and copied per call
+    # instead of constructing a fresh context each time
+    _PROTOTYPES: ClassVar[dict[str, Any]] = {}
+
+    DOCUMENTATION: ClassVar[str] = f'Syntax: Hash <InputText | @InputFile | @@LinesFile> < {" | ".join(ALGORITHMS)} >'
 
     def execute(self, argv: list[str]) -> None:
         if len(argv) == 0:
             print(HashCommand.DOCUMENTATION)
             return None
 
-        self._validate_argv(argv)
+        if len(argv) != 2:
+            raise ValueError(f'This command takes exactly 2 arguments: {self.name}')
+
         input_data, algorithm = argv
-        input_data_bytes = input_data.encode()
 
-        hashing_fn = HashCommand.ALGORITHMS[algorithm.upper().strip()]
-        print(hashing_fn(input_data_bytes).hexdigest())
+        name = HashCommand.ALGORITHMS.get(algorithm.upper())
+        if name is None:
+            raise ValueError(f'Invalid algorithm name: {algorithm}; '
+                             f'Available algorithms: {" | ".join(HashCommand.ALGORITHMS)}')
 
-    def _validate_argv(self, argv: list[str]) -> None:
-        if len(argv) != 2:
-            raise ValueError(f'This command takes exactly 2 arguments: {self.name}')
+        prototype = HashCommand._PROTOTYPES.get(name)
+        if prototype is None:
+            prototype = HashCommand._PROTOTYPES[name] = _new_hasher(name)
+
+        source, input_data = _split_input_source(input_data)
+        if source == LINES_INPUT_PREFIX:
+            self._hash_lines(input_data, prototype)
+            return None
+
+        if source == FILE_INPUT_PREFIX:
+            print(self._hash_file(input_data, prototype))
+            return None
+
+        input_data_bytes = input_data.encode()
 
-        _, algorithm = argv
-        if algorithm.upper() not in HashCommand.ALGORITHMS.keys():
-            raise ValueError(f'Invalid algorithm name: {algorithm}; Available algorithms: {HashCommand.ALGORITHMS.keys()}')
+        hasher = prototype.copy()
+        if len(input_data_bytes) > CHUNK_SIZE:
+            # feed large payloads in slices so each update works on cache-friendly blocks
+            view = memoryview(input_data_bytes)
+            for offset in range(0, len(view), CHUNK_SIZE):
+                hasher.update(view[offset:offset + CHUNK_SIZE])
+        else:
+            hasher.update(input_data_bytes)
+        print(hasher.hexdigest())
+
+    def _hash_lines(self, path: str, prototype: Any) -> None:
+        for line in _read_input_lines(path):
+            hasher = prototype.copy()
+            hasher.update(line)
+            sys.stdout.write(hasher.hexdigest() + '\n')
+
+    def _hash_file(self, path: str, prototype: Any) -> str:
+        if hasattr(prototype, 'update_mmap'):
+            # BLAKE3 maps the file itself and hashes it in parallel
+            hasher = prototype.copy()
+            try:
+                hasher.update_mmap(path)
+            except OSError as error:
+                raise _input_file_error(path, error) from error
+            return hasher.hexdigest()
+
+        with _open_input_file(path) as file:
+            if file_digest is not None:
+                return file_digest(file, prototype.copy).hexdigest()
+
+            hasher = prototype.copy()
+            while chunk := file.read(CHUNK_SIZE):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
+
+_FACTORY: dict[CommandName, type[Command]] = {
+    CommandName.EXIT: ExitCommand,
+    CommandName.HELP: HelpCommand,
+    CommandName.ENCODE: EncodeCommand,
+    CommandName.DECODE: DecodeCommand,
+    CommandName.HASH: HashCommand,
+}
@@ -1,4 +1,7 @@
 
+import sys
+from typing import Callable, Iterator
+
 from colorama import Fore  # type: ignore
 from .command import (  # type: ignore
     Command, CommandName, command_factory, str_to_command_name,
@@ -12,24 +15,40 @@ class Shell:
         self.supported_commands: dict[CommandName, Command] = {
             name: command_factory(name) for name in CommandName
         }
+        # bound execute methods, so dispatching skips the method attribute lookup
+        self._executors: dict[CommandName, Callable[[list[str]], None]] = {
+            name: command.execute for name, command in self.supported_commands.items()
+        }
+        self._interactive = sys.stdin.isatty()
+        self._prompt = f"  {Fore.YELLOW}[*] {Fore.CYAN}-> {Fore.WHITE}"
 
     def enter_command_to_execute(self) -> None:
-        while True:
-            user_input = input(f"  {Fore.YELLOW}[*] {Fore.CYAN}-> {Fore.WHITE}")
+        for user_input in self._read_commands():
             try:
                 self.execute_command(user_input)
             except (CommandNameConversionError, ValueError) as error:
                 print(error)
                 continue
 
+    def _read_commands(self) -> Iterator[str]:
+        if not self._interactive:
+            # piped / scripted input: stream lines from stdin without printing prompts
+            yield from sys.stdin
+            return
+
+        while True:
+            try:
+                yield input(self._prompt)
+            except EOFError:
+                return
+
     def execute_command(self, cmd: str) -> None:
         command_name, argv = self._parse_cmd(cmd)
-        self.supported_commands[command_name].execute(argv)
+        self._executors[command_name](argv)
 
     def _parse_cmd(self, cmd: str) -> tuple[CommandName, list[str]]:
-        input_elements = cmd.split(' ')
-        binary = input_elements[0].strip().upper()
-        argv = [i.strip() for i in input_elements[1:]]
+        # split() without a separator strips and collapses whitespace in one pass
+        binary, *argv = cmd.split() or ['']
 
         command_name = str_to_command_name(binary)
         return command_name, argv